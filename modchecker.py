@@ -2,8 +2,10 @@
 # /// script
 # dependencies = [
 #   "requests",
-#   "tomli",
+#   "tomli; python_version < '3.11'",
 #   "colorama",
+#   "orjson",
+#   "packaging",
 # ]
 # ///
 
@@ -13,41 +15,212 @@ modchecker.py - Minecraft Mod Version and Slug Checker/Updater
 Checks and updates Minecraft mod versions and IDs using the Modrinth API.
 """
 
+import os
+import re
 import sys
+import json
+import time
+import hashlib
 import argparse
-from typing import Dict, List, Optional, Any, Tuple, Callable
+import operator
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
 
-import requests
-import tomli
 from colorama import init, Fore, Style
+from packaging.version import InvalidVersion, Version
 
-# Initialize colorama for colored terminal output
-init()
+# requests (with urllib3) and orjson are imported lazily inside
+# ModrinthClient; they cost ~150 ms that --help and argparse-error
+# paths should not pay
 
 # --- Constants ---
 MODRINTH_API = "https://api.modrinth.com/v2"
 USER_AGENT = "github/LunchChecker/1.0.0 (Minecraft Mod Version Checker)"
+CACHE_DIR = ".modcheck_cache"
+
+# Matches the leading version components; minor and patch are optional
+_VER_RE = re.compile(r"(\d+)(?:\.(\d+))?(?:\.(\d+))?")
+
+# Field lines inside [[mods]] sections, tolerant of spacing around '='
+_ID_LINE_RE = re.compile(r'id\s*=\s*"([^"]+)"\s*$')
+_VERSION_LINE_RE = re.compile(r"version\s*=\s*")
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# The only version-record fields the display path reads; the rest (file
+# hashes, dependency lists, download counts) are dropped after filtering
+_VERSION_FIELDS = ("id", "version_number", "version_type", "date_published", "changelog")
+
+# ANSI escapes bound once; blank when stdout isn't a terminal so piped
+# output carries no color codes
+if sys.stdout.isatty():
+    CYAN, RED, YELLOW, GREEN, RESET = Fore.CYAN, Fore.RED, Fore.YELLOW, Fore.GREEN, Style.RESET_ALL
+else:
+    CYAN = RED = YELLOW = GREEN = RESET = ""
 
 # Global debug flag
 DEBUG = False
 
-def debug_log(message: str) -> None:
-    """Print a debug message if debug mode is enabled."""
+def _parse_max_age(headers: Any) -> int:
+    """Extract the max-age value from a response's Cache-Control header."""
+    match = _MAX_AGE_RE.search(headers.get("Cache-Control", ""))
+    return int(match.group(1)) if match else 0
+
+
+def debug_log(message: str, *args: Any) -> None:
+    """Print a debug message if debug mode is enabled.
+
+    Accepts %-style arguments so the formatting work is deferred until
+    debug mode is actually on.
+    """
     if DEBUG:
-        print(f"DEBUG: {message}")
+        print(f"DEBUG: {message % args if args else message}")
 
 
 # --- Utility Classes ---
+class _TomlEditSession:
+    """In-memory edit buffer over one TOML file's lines.
+
+    Mutations share a single lines buffer and mod index, so a run that
+    changes both IDs and versions never re-reads a stale file between
+    edits; the owning TomlHandler writes the buffer back once.
+    """
+
+    def __init__(self, lines: List[str], index: Dict[str, Dict[str, Any]]):
+        self.lines = lines
+        self.index = index
+        self.dirty = 0
+
+    def set_version(self, mod_id: str, new_version: str) -> bool:
+        """Patch the version line of a mod in the buffer."""
+        entry = self.index.get(mod_id)
+        if not entry or entry["version_line"] < 0:
+            debug_log("Failed to find version line for mod '%s'", mod_id)
+            return False
+        self.lines[entry["version_line"]] = f'{entry["version_indent"]}version = "{new_version}"\n'
+        self.dirty += 1
+        debug_log("Updated version at line %d to '%s'", entry["version_line"], new_version)
+        return True
+
+    def set_id(self, mod_id: str, new_id: str) -> bool:
+        """Patch the ID line of a mod and re-key the index to the new ID."""
+        entry = self.index.pop(mod_id, None)
+        if not entry:
+            debug_log("Failed to find ID line for mod '%s'", mod_id)
+            return False
+        self.lines[entry["id_line"]] = f'{entry["indent"]}id = "{new_id}"\n'
+        # Keep later edits addressable by the new ID
+        self.index[new_id] = entry
+        self.dirty += 1
+        debug_log("Updated ID at line %d to '%s'", entry["id_line"], new_id)
+        return True
+
+
 class TomlHandler:
-    """Handles reading and updating TOML configuration files."""
+    """Handles reading and updating TOML configuration files.
+
+    Edits patch individual lines in place instead of reserializing the
+    parsed tree: server.toml is hand-maintained, and a round trip through
+    a TOML writer would discard its comments and formatting. The section
+    index keeps those structural edits O(1) after a single parse.
+    """
+
+    def __init__(self):
+        # Mod-section index cache, keyed by (file_path, mtime)
+        self._index_cache: Dict[Tuple[str, float], Dict[str, Dict[str, Any]]] = {}
+
+    @staticmethod
+    def _index_mods(lines: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Build an index of the [[mods]] sections in one pass over the lines.
+
+        Maps each mod ID to its section bounds, the line numbers of its
+        ``id`` and ``version`` fields, and their indentation, so updates
+        become O(1) lookups instead of full-file scans.
+        """
+        index: Dict[str, Dict[str, Any]] = {}
+        start = -1
+        mod_id: Optional[str] = None
+        entry: Dict[str, Any] = {}
+
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+
+            if stripped.startswith("[["):
+                if mod_id is not None:
+                    entry["section"] = (start, i)
+                    index[mod_id] = entry
+                    mod_id = None
+                start = i if stripped == "[[mods]]" else -1
+                continue
+
+            if start < 0:
+                continue
+
+            if mod_id is None:
+                id_match = _ID_LINE_RE.match(stripped)
+                if id_match:
+                    mod_id = id_match.group(1)
+                    entry = {"id_line": i, "version_line": -1, "indent": line[: line.index("id")]}
+            elif entry["version_line"] < 0 and _VERSION_LINE_RE.match(stripped):
+                entry["version_line"] = i
+                entry["version_indent"] = line[: line.index("version")]
+
+        if mod_id is not None:
+            entry["section"] = (start, len(lines))
+            index[mod_id] = entry
+
+        return index
+
+    def _load_indexed(self, file_path: str) -> Tuple[Optional[List[str]], Dict[str, Dict[str, Any]]]:
+        """Read a file and return (lines, mod index), caching the index by mtime."""
+        lines = self._read_file_lines(file_path)
+        if not lines:
+            return None, {}
+
+        try:
+            key = (file_path, os.path.getmtime(file_path))
+        except OSError:
+            key = None
+
+        if key is not None and key in self._index_cache:
+            return lines, self._index_cache[key]
+
+        index = self._index_mods(lines)
+        if key is not None:
+            self._index_cache[key] = index
+        return lines, index
+
+    @contextmanager
+    def open_session(self, file_path: str):
+        """Batch many edits to one file behind a single read and write.
+
+        Reads the file once, yields a _TomlEditSession whose mutations
+        operate on the in-memory lines, and writes the buffer back once on
+        exit if anything changed.
+        """
+        lines, index = self._load_indexed(file_path)
+        # The index is copied so set_id re-keying can't corrupt the cache
+        session = _TomlEditSession(lines or [], dict(index))
+        yield session
+        if lines and session.dirty:
+            self._write_file_lines(file_path, session.lines)
 
     @staticmethod
     def load_config(file_path: str) -> Dict[str, Any]:
         """Load and parse a TOML configuration file."""
         try:
             with open(file_path, "rb") as f:
-                return tomli.load(f)
-        except (IOError, tomli.TOMLDecodeError) as e:
+                return tomllib.load(f)
+        except (IOError, tomllib.TOMLDecodeError) as e:
             print(f"Error loading {file_path}: {e}", file=sys.stderr)
             sys.exit(1)
 
@@ -72,170 +245,253 @@ class TomlHandler:
             print(f"Error writing {file_path}: {e}", file=sys.stderr)
             return False
 
-    def _update_toml_field(
-        self,
-        file_path: str,
-        find_predicate: Callable[[str], bool],
-        update_predicate: Callable[[str], bool],
-        update_func: Callable[[str], str],
-    ) -> bool:
-        """Generic method to find and update fields in TOML files.
-
-        Args:
-            file_path: Path to TOML file
-            find_predicate: Function that returns True when the target section is found
-            update_predicate: Function that returns True when the line to update is found
-            update_func: Function that receives the line and returns the updated line
-        """
-        lines = self._read_file_lines(file_path)
-        if not lines:
-            debug_log(f"Failed to read file lines from {file_path}")
-            return False
-
-        found_target = False
-        updated = False
-        debug_counter = 0
-
-        for i, line in enumerate(lines):
-            line_stripped = line.strip()
-
-            # Debug print for target lines
-            if debug_counter < 20:  # Limit debug output
-                if find_predicate(line_stripped):
-                    debug_log(f"Found target at line {i}: '{line_stripped}'")
-                if update_predicate(line_stripped):
-                    debug_log(f"Found update candidate at line {i}: '{line_stripped}'")
-                debug_counter += 1
-
-            if find_predicate(line_stripped):
-                found_target = True
-                debug_log(f"Set found_target = True at line {i}")
-                continue
-
-            if found_target and update_predicate(line_stripped):
-                old_line = lines[i]
-                lines[i] = update_func(line)
-                updated = True
-                debug_log(f"Updated line {i} from '{old_line.strip()}' to '{lines[i].strip()}'")
-                break
+    def update_version(self, file_path: str, mod_id: str, new_version: str) -> bool:
+        """Update a mod's version in the TOML file."""
+        debug_log("Looking for mod with ID '%s' to update version to %s", mod_id, new_version)
+        with self.open_session(file_path) as session:
+            return session.set_version(mod_id, new_version)
 
-            # Reset search when we hit a section boundary
-            if found_target and line_stripped.startswith("[["):
-                debug_log(f"Reset found_target at line {i} due to section boundary: '{line_stripped}'")
-                found_target = False
+    def apply_updates(self, file_path: str, version_updates: Dict[str, str], slug_updates: Dict[str, str]) -> int:
+        """Apply many version and ID updates to a TOML file in one pass.
 
-        if not updated:
-            debug_log("No matching line was found to update")
+        Reads and scans the file once to build the mod index, patches every
+        pending ``version = ...`` and ``id = ...`` line by direct lookup, and
+        writes the file back once — O(lines + updates) total regardless of
+        how many mods change. Returns the number of fields that were updated.
+        """
+        if not version_updates and not slug_updates:
+            return 0
 
-        result = updated and self._write_file_lines(file_path, lines)
-        debug_log(f"Final result of update operation: {result}")
-        return result
+        with self.open_session(file_path) as session:
+            applied = 0
+            for mod_id, slug in slug_updates.items():
+                applied += session.set_id(mod_id, slug)
+            for mod_id, new_version in version_updates.items():
+                applied += session.set_version(mod_id, new_version)
+        return applied
 
-    def update_version(self, file_path: str, mod_id: str, new_version: str) -> bool:
-        """Update a mod's version in the TOML file."""
-        lines = self._read_file_lines(file_path)
-        if not lines:
-            debug_log(f"Failed to read file lines from {file_path}")
-            return False
+    def update_id_to_slug(self, file_path: str, mod_id: str, slug: str) -> bool:
+        """Update a mod's ID to its slug in the TOML file."""
+        with self.open_session(file_path) as session:
+            return session.set_id(mod_id, slug)
 
-        updated = False
-        in_mod_section = False
 
-        debug_log(f"Looking for mod with ID '{mod_id}' to update version to {new_version}")
+class _DiskCache:
+    """Small on-disk store of API responses keyed by URL, for ETag revalidation."""
 
-        for i, line in enumerate(lines):
-            line_stripped = line.strip()
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        self.cache_dir = cache_dir
 
-            # Check for the start of a mod section
-            if line_stripped == "[[mods]]":
-                in_mod_section = True
-                debug_log(f"Found mod section at line {i}")
-                continue
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
 
-            # If we're in a mod section, look for the correct mod ID
-            if in_mod_section and line_stripped == f'id = "{mod_id}"':
-                debug_log(f"Found target mod with ID '{mod_id}' at line {i}")
-
-                # Look for the version line in the next few lines
-                for j in range(i + 1, min(i + 5, len(lines))):  # Check next few lines
-                    version_line = lines[j].strip()
-                    if version_line.startswith("version = "):
-                        # Found the version line, update it
-                        old_line = lines[j]
-                        indent = lines[j][: lines[j].index("version")]
-                        lines[j] = f'{indent}version = "{new_version}"\n'
-                        updated = True
-                        debug_log(f"Updated version at line {j} from '{old_line.strip()}' to '{lines[j].strip()}'")
-                        break
-
-                # If we found the right mod ID, no need to continue checking other mods
-                break
-
-            # Reset when we hit a new section (but not at the initial [[mods]] line)
-            if in_mod_section and i > 0 and (line_stripped.startswith("[[") and line_stripped != "[[mods]]"):
-                in_mod_section = False
-                debug_log(f"End of mod section at line {i}")
-
-        if not updated:
-            debug_log(f"Failed to find version line for mod '{mod_id}'")
-
-        # Only write to the file if we actually made a change
-        if updated:
-            result = self._write_file_lines(file_path, lines)
-            debug_log(f"File write result: {result}")
-            return result
-        return False
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for a key, or None if absent/corrupt."""
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            return None
 
-    def update_id_to_slug(self, file_path: str, mod_id: str, slug: str) -> bool:
-        """Update a mod's ID to its slug in the TOML file."""
-        lines = self._read_file_lines(file_path)
-        if not lines:
-            return False
+    def store(self, key: str, entry: Dict[str, Any]) -> None:
+        """Persist an entry for a key; caching is best-effort."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._path(key), "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+        except IOError:
+            pass
 
-        updated = False
 
-        for i, line in enumerate(lines):
-            line_stripped = line.strip()
+class _RateLimiter:
+    """Token-bucket limiter shared by worker threads to pace API requests."""
 
-            if line_stripped == f'id = "{mod_id}"':
-                indent = line[: line.index("id")]
-                lines[i] = f'{indent}id = "{slug}"\n'
-                updated = True
-                break
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
 
-        return updated and self._write_file_lines(file_path, lines)
+    def acquire(self) -> None:
+        """Block until the next request slot is available."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
 
 
 class ModrinthClient:
     """Client for interacting with the Modrinth API."""
 
     def __init__(self, api_base: str = MODRINTH_API, user_agent: str = USER_AGENT):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
         self.api_base = api_base
-        self.headers = {"User-Agent": user_agent}
+        # Reuse one keep-alive connection pool for all API calls instead of
+        # paying a fresh TCP+TLS handshake per request.
+        self.session = requests.Session()
+        # Ask for compressed payloads explicitly; version lists with changelogs
+        # and file hashes compress several-fold, and requests decodes for us
+        self.session.headers.update({"User-Agent": user_agent, "Accept-Encoding": "gzip, deflate"})
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=retries))
+        # 5 req/sec keeps concurrent workers under Modrinth's 300 req/min limit
+        self._limiter = _RateLimiter(rate=5.0)
+        self._cache = _DiskCache()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its connection pool."""
+        self.session.close()
+
+    def __enter__(self) -> "ModrinthClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _get(self, url: str, params: Optional[Dict[str, str]] = None) -> Any:
+        """Issue a rate-limited GET, revalidating against the disk cache.
+
+        Sends If-None-Match when a cached copy exists and serves it back on a
+        304, so unchanged payloads cost a handful of header bytes instead of a
+        full JSON body. Raises requests.RequestException on failure.
+        """
+        cache_key = url if not params else f"{url}?{sorted(params.items())}"
+        cached = self._cache.load(cache_key)
+        headers = {}
+        if cached:
+            # Entries still inside their Cache-Control max-age window are
+            # served without touching the network at all
+            if time.time() - cached.get("fetched_at", 0) < cached.get("max_age", 0):
+                debug_log("Cache fresh for %s", url)
+                return cached["body"]
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+
+        self._limiter.acquire()
+        response = self.session.get(url, params=params, headers=headers)
+        self._respect_rate_limit(response)
+        if response.status_code == 304 and cached:
+            debug_log("Cache hit (304) for %s", url)
+            cached["fetched_at"] = time.time()
+            cached["max_age"] = _parse_max_age(response.headers)
+            self._cache.store(cache_key, cached)
+            return cached["body"]
+        response.raise_for_status()
+
+        body = self._json(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._cache.store(
+                cache_key,
+                {
+                    "etag": etag,
+                    "fetched_at": time.time(),
+                    "max_age": _parse_max_age(response.headers),
+                    "body": body,
+                },
+            )
+        return body
+
+    @staticmethod
+    def _respect_rate_limit(response: Any) -> None:
+        """Back off when the server reports the rate-limit budget nearly spent.
+
+        Modrinth sends X-Ratelimit-Remaining/-Reset on every response; when
+        fewer than 20 requests are left in the window, sleep until it resets
+        so a large run degrades to a pause instead of a burst of 429s. Actual
+        429s are retried with backoff by the session's HTTPAdapter.
+        """
+        try:
+            remaining = int(response.headers.get("X-Ratelimit-Remaining", ""))
+        except ValueError:
+            return
+        if remaining < 20:
+            try:
+                reset = float(response.headers.get("X-Ratelimit-Reset", "1"))
+            except ValueError:
+                reset = 1.0
+            debug_log("Rate limit nearly exhausted (%d left); sleeping %.1fs", remaining, reset)
+            time.sleep(reset)
+
+    @staticmethod
+    def _json(response: Any) -> Any:
+        """Decode a response body, preferring orjson over stdlib json.
+
+        orjson decodes the large /version payloads several times faster,
+        but the script still works from environments where it isn't
+        installed.
+        """
+        try:
+            import orjson
+        except ImportError:
+            return response.json()
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # Re-decode through requests so a malformed body raises its
+            # JSONDecodeError, a RequestException the callers already catch
+            return response.json()
 
     def get_mod_info(self, mod_id: str) -> Optional[Dict[str, Any]]:
         """Fetch mod information from Modrinth API."""
+        import requests
+
         try:
-            response = requests.get(f"{self.api_base}/project/{mod_id}", headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+            return self._get(f"{self.api_base}/project/{mod_id}")
         except requests.RequestException as e:
             print(f"Error fetching mod {mod_id}: {e}", file=sys.stderr)
             return None
 
+    def get_mods_info(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch information for many mods with bulk /projects calls.
+
+        Returns a mapping keyed by both project ID and slug, so callers can
+        look up a project by whichever identifier the config file uses.
+        """
+        import requests
+
+        projects: Dict[str, Dict[str, Any]] = {}
+        # Dedupe while preserving order; repeated ids would waste batch slots
+        ids = list(dict.fromkeys(ids))
+        # Modrinth caps the bulk endpoint at around 100 ids per request
+        for start in range(0, len(ids), 100):
+            chunk = ids[start : start + 100]
+            try:
+                batch = self._get(f"{self.api_base}/projects", params={"ids": json.dumps(chunk)})
+            except requests.RequestException as e:
+                print(f"Error fetching mods {', '.join(chunk)}: {e}", file=sys.stderr)
+                continue
+            for project in batch:
+                projects[project["id"]] = project
+                if project.get("slug"):
+                    projects[project["slug"]] = project
+        return projects
+
     def get_mod_versions(self, mod_id: str, mc_version: str, mod_loader: str) -> List[Dict[str, Any]]:
         """Fetch and filter mod versions from Modrinth API."""
-        try:
-            response = requests.get(f"{self.api_base}/project/{mod_id}/version", headers=self.headers)
-            response.raise_for_status()
-            versions = response.json()
+        import requests
 
-            # Filter versions by Minecraft version and mod loader
-            filtered_versions = self._filter_versions(versions, mc_version, mod_loader)
+        try:
+            # Filter server-side so only matching versions cross the wire
+            versions = self._get(
+                f"{self.api_base}/project/{mod_id}/version",
+                params={"loaders": json.dumps([mod_loader]), "game_versions": json.dumps([mc_version])},
+            )
 
-            # Sort versions by publish date (newest first)
-            filtered_versions.sort(key=lambda x: x.get("date_published", ""), reverse=True)
-            return filtered_versions
+            # Re-filter client-side as a sanity fallback, then slim each
+            # record to the consumed fields. The result is left unsorted;
+            # callers pick the entries they need in O(n)
+            filtered = self._filter_versions(versions, mc_version, mod_loader)
+            return [{k: v[k] for k in _VERSION_FIELDS if k in v} for v in filtered]
         except requests.RequestException as e:
             print(f"Error fetching versions for mod {mod_id}: {e}", file=sys.stderr)
             return []
@@ -243,31 +499,63 @@ class ModrinthClient:
     @staticmethod
     def _filter_versions(versions: List[Dict[str, Any]], mc_version: str, mod_loader: str) -> List[Dict[str, Any]]:
         """Filter versions by Minecraft version and mod loader."""
-        return [
-            v
-            for v in versions
-            if (
-                mod_loader in [loader.lower() for loader in v.get("loaders", [])]
-                and mc_version in v.get("game_versions", [])
-            )
-        ]
+        loader = mod_loader.lower()
+
+        def matches(version: Dict[str, Any]) -> bool:
+            if mc_version not in version.get("game_versions", ()):
+                return False
+            loaders = version.get("loaders", ())
+            # Modrinth serves loader names lowercase, so the plain membership
+            # test usually hits; the any() fallback covers mixed-case records
+            return loader in loaders or any(candidate.lower() == loader for candidate in loaders)
+
+        return [v for v in versions if matches(v)]
 
 
 class ModManager:
     """Manager for handling Minecraft mods and their configuration."""
 
-    def __init__(self, config_path: str, mc_version: str, mod_loader: str):
+    def __init__(self, config_path: str, mc_version: str, mod_loader: str, config: Optional[Dict[str, Any]] = None):
         self.config_path = config_path
         self.mc_version = mc_version
         self.mod_loader = mod_loader
         self.client = ModrinthClient()
         self.toml_handler = TomlHandler()
-        self.config = self.toml_handler.load_config(config_path)
+        # Reuse the caller's parsed config instead of parsing the file again
+        self.config = config if config is not None else self.toml_handler.load_config(config_path)
+        # Modrinth mods indexed by config ID for O(1) targeted lookups
+        self._mods_by_id = {
+            mod["id"]: mod for mod in self.config.get("mods", []) if mod.get("type") == "modrinth" and mod.get("id")
+        }
+        # Staged file edits, flushed in a single pass at the end of a run
+        self._pending_versions: Dict[str, str] = {}
+        self._pending_slugs: Dict[str, str] = {}
+
+    def _flush_pending_updates(self) -> None:
+        """Write all staged version/slug edits to disk in one read/patch/write pass."""
+        staged = len(self._pending_versions) + len(self._pending_slugs)
+        if not staged:
+            return
+        applied = self.toml_handler.apply_updates(self.config_path, self._pending_versions, self._pending_slugs)
+        if applied < staged:
+            print(
+                f"Warning: only {applied} of {staged} staged change(s) were written to {self.config_path}",
+                file=sys.stderr,
+            )
+        self._pending_versions.clear()
+        self._pending_slugs.clear()
+
+    def close(self) -> None:
+        """Release the Modrinth client's network resources."""
+        self.client.close()
 
     # --- User Interaction ---
     @staticmethod
     def prompt_yes_no(question: str) -> bool:
         """Prompt the user for a yes/no answer."""
+        # input() only flushes stdout on a tty; flush explicitly so the
+        # buffered status block always lands before the prompt
+        sys.stdout.flush()
         while True:
             answer = input(f"{question} (y/n): ").lower().strip()
             if answer in ["y", "yes"]:
@@ -280,62 +568,55 @@ class ModManager:
     @staticmethod
     def get_version_color(current_ver: str, latest_ver: str) -> str:
         """Determine the color to use for version display based on version difference significance."""
-        current_base = current_ver.split("+")[0].split("-")[0]
-        latest_base = latest_ver.split("+")[0].split("-")[0]
         try:
-            current_parts = current_base.split(".")
-            latest_parts = latest_base.split(".")
-            for i in range(min(len(current_parts), len(latest_parts))):
-                if latest_parts[i] != current_parts[i]:
-                    if i == 0:  # Major version change
-                        return Fore.RED
-                    elif i == 1:  # Minor version change
-                        return Fore.YELLOW
-                    else:  # Patch version change
-                        return Fore.GREEN
-        except (ValueError, IndexError):
-            pass
-        return Fore.GREEN
+            # PEP 440 parsing handles pre-release and build-metadata suffixes
+            current_parts: Tuple[Any, ...] = Version(current_ver).release
+            latest_parts: Tuple[Any, ...] = Version(latest_ver).release
+        except InvalidVersion:
+            # Fall back to comparing the leading numeric triplet
+            current = _VER_RE.match(current_ver)
+            latest = _VER_RE.match(latest_ver)
+            if not (current and latest):
+                return GREEN
+            current_parts = current.groups(default="0")
+            latest_parts = latest.groups(default="0")
+
+        if latest_parts[:1] != current_parts[:1]:  # Major version change
+            return RED
+        if latest_parts[1:2] != current_parts[1:2]:  # Minor version change
+            return YELLOW
+        return GREEN
+
+    # Shared wrapper; constructing a TextWrapper is the expensive part of
+    # textwrap, so build it once for the default width
+    _wrapper = textwrap.TextWrapper(width=70, break_long_words=False, break_on_hyphens=False)
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def format_changelog(changelog: str, width: int = 70) -> str:
         """Format changelog text for display with line wrapping."""
         if not changelog:
             return ""
 
-        # Split into lines and filter empty ones
-        lines = [line.strip() for line in changelog.split("\n") if line.strip()]
-        formatted_lines = []
+        wrapper = ModManager._wrapper
+        if width != wrapper.width:
+            wrapper = textwrap.TextWrapper(width=width, break_long_words=False, break_on_hyphens=False)
 
-        for line in lines:
+        # Strip, filter, and wrap in a single pass over the text
+        formatted_lines = []
+        for line in changelog.split("\n"):
+            line = line.strip()
+            if not line:
+                continue
             if len(line) > width:
                 # Word wrap long lines
-                wrapped_lines = ModManager._wrap_line(line, width)
-                formatted_lines.extend(wrapped_lines)
+                formatted_lines.extend(wrapper.wrap(line))
             else:
                 formatted_lines.append(line)
 
         # Add indentation to each line
         return "\n".join(f"  {line}" for line in formatted_lines)
 
-    @staticmethod
-    def _wrap_line(line: str, width: int) -> List[str]:
-        """Wrap a single line to the specified width."""
-        wrapped_lines = []
-        current_line = ""
-
-        for word in line.split():
-            if len(current_line) + len(word) + 1 <= width:
-                current_line += f" {word}" if current_line else word
-            else:
-                wrapped_lines.append(current_line)
-                current_line = word
-
-        if current_line:
-            wrapped_lines.append(current_line)
-
-        return wrapped_lines
-
     # --- Mod Status and Update Logic ---
     def display_mod_status(
         self,
@@ -348,21 +629,24 @@ class ModManager:
         mod_id = mod_info["id"]
         mod_title = mod_info["title"]
 
-        # Display basic mod info
-        print(f"Mod: {mod_title} ({mod_id})")
-        self._display_slug_info(mod_info, mod_id)
+        # Buffer the status block and emit it with as few writes as possible;
+        # each print() on a tty costs a write syscall
+        out: List[str] = [f"Mod: {mod_title} ({mod_id})"]
+        self._display_slug_info(mod_info, mod_id, out)
 
         if not versions:
-            print("Status: No compatible version found")
-            print("-" * 80)
+            out.append("Status: No compatible version found")
+            out.append("-" * 80)
+            sys.stdout.write("\n".join(out) + "\n")
             return False, 0
 
-        # Get version information
-        latest_version = versions[0]
+        # Get version information; only the newest release and the current one
+        # matter, so a linear max() beats sorting the whole list
+        latest_version = max(versions, key=operator.itemgetter("date_published"))
         current_version = next((v for v in versions if v["id"] == current_version_id), None)
 
         # Display version information
-        self._display_version_info(current_version, current_version_id, latest_version)
+        self._display_version_info(current_version, current_version_id, latest_version, out)
 
         # Check if update is needed
         needs_update = not current_version or latest_version["id"] != current_version_id
@@ -373,49 +657,51 @@ class ModManager:
                 current_version,
                 current_version_id,
                 latest_version,
-                mod_id,
-                mod_title,
+                mod_info,
                 update_mode,
+                out,
             )
         else:
-            print("Status: Up to date")
+            out.append("Status: Up to date")
 
-        print("-" * 80)
+        out.append("-" * 80)
+        sys.stdout.write("\n".join(out) + "\n")
         return needs_update, updates_performed
 
-    def _display_slug_info(self, mod_info: Dict[str, Any], mod_id: str) -> None:
-        """Display slug information if different from mod ID."""
+    def _display_slug_info(self, mod_info: Dict[str, Any], mod_id: str, out: List[str]) -> None:
+        """Buffer slug information if different from mod ID."""
         if "slug" in mod_info and mod_info["slug"] != mod_id:
-            print(f"Slug: {Fore.CYAN}{mod_info['slug']}{Style.RESET_ALL}")
+            out.append(f"Slug: {CYAN}{mod_info['slug']}{RESET}")
 
     def _display_version_info(
         self,
         current_version: Optional[Dict[str, Any]],
         current_version_id: str,
         latest_version: Dict[str, Any],
+        out: List[str],
     ) -> None:
-        """Display current and latest version information."""
+        """Buffer current and latest version information."""
         if current_version:
             version_type = current_version.get("version_type", "release")
-            print(f"Current Version: {current_version['version_number']} ({version_type})")
+            out.append(f"Current Version: {current_version['version_number']} ({version_type})")
         else:
-            print(f"Current Version: {current_version_id} (version info not found)")
+            out.append(f"Current Version: {current_version_id} (version info not found)")
 
         version_type = latest_version.get("version_type", "release")
-        print(f"Latest Version: {latest_version['version_number']} ({version_type})")
+        out.append(f"Latest Version: {latest_version['version_number']} ({version_type})")
 
     def _handle_update_needed(
         self,
         current_version: Optional[Dict[str, Any]],
         current_version_id: str,
         latest_version: Dict[str, Any],
-        mod_id: str,
-        mod_title: str,
+        mod_info: Dict[str, Any],
         update_mode: bool,
+        out: List[str],
     ) -> int:
         """Handle the case when a mod needs an update. Returns number of updates performed."""
         # Determine color based on version difference
-        color = Fore.GREEN
+        color = GREEN
         if current_version:
             color = self.get_version_color(
                 current_version.get("version_number", "0.0.0"),
@@ -424,45 +710,45 @@ class ModManager:
 
         # Display update information
         date = latest_version.get("date_published", "").split("T")[0]
-        print(f"Status: {color}Update Available!{Style.RESET_ALL} (published {date})")
+        out.append(f"Status: {color}Update Available!{RESET} (published {date})")
 
-        # Display changelog if available
-        changelog = latest_version.get("changelog", "").strip()
+        # Display changelog if available; format_changelog drops
+        # whitespace-only input, so no pre-strip is needed
+        changelog = self.format_changelog(latest_version.get("changelog", ""))
         if changelog:
-            print("\nChangelog:")
-            print(self.format_changelog(changelog))
+            out.append("\nChangelog:")
+            out.append(changelog)
 
-        # Prompt for update if in update mode
+        # Prompt for update if in update mode; flush the buffered status block
+        # first so the prompt appears after it
         if update_mode:
-            return self._perform_update(mod_id, mod_title, current_version_id, latest_version, color)
+            sys.stdout.write("\n".join(out) + "\n")
+            out.clear()
+            return self._perform_update(mod_info, current_version_id, latest_version, color)
         return 0
 
     def _perform_update(
         self,
-        mod_id: str,
-        mod_title: str,
+        mod_info: Dict[str, Any],
         current_version_id: str,
         latest_version: Dict[str, Any],
         color: str,
     ) -> int:
         """Perform the update if user confirms. Returns 1 if updated, 0 otherwise."""
-        if self.prompt_yes_no(f"Do you want to update this mod to version {latest_version['version_number']}?"):
-            print(f"Updating version from {current_version_id} to {color}{latest_version['id']}{Style.RESET_ALL}")
+        mod_id = mod_info["id"]
+        mod_title = mod_info["title"]
 
-            # Get mod info to find the slug
-            mod_info = self.client.get_mod_info(mod_id)
-            if not mod_info or "slug" not in mod_info:
-                print(f"Error: Could not find slug for mod {mod_id}")
-                return 0
+        if self.prompt_yes_no(f"Do you want to update this mod to version {latest_version['version_number']}?"):
+            print(f"Updating version from {current_version_id} to {color}{latest_version['id']}{RESET}")
 
-            mod_slug = mod_info["slug"]
-            debug_log(f"Using slug '{mod_slug}' to update mod with ID '{mod_id}'")
+            # The slug comes from the already-fetched project metadata
+            mod_slug = mod_info.get("slug", mod_id)
+            debug_log("Using slug '%s' to update mod with ID '%s'", mod_slug, mod_id)
 
-            if self.toml_handler.update_version(self.config_path, mod_slug, latest_version["id"]):
-                print(f"Successfully updated {mod_title}!")
-                return 1
-            else:
-                print(f"Failed to update version for {mod_title}")
+            # Stage the edit; all staged edits are written in one pass at the end
+            self._pending_versions[mod_slug] = latest_version["id"]
+            print(f"Staged update for {mod_title}!")
+            return 1
         else:
             print("Skipping version update.")
         return 0
@@ -470,17 +756,13 @@ class ModManager:
     def update_slugs(self) -> int:
         """Update mod IDs to slugs without changing versions. Returns the number of slugs updated."""
         slugs_updated = 0
-        for mod in self.config.get("mods", []):
-            # Skip non-Modrinth mods
-            if mod.get("type") != "modrinth":
-                continue
+        mod_ids = list(self._mods_by_id)
 
-            mod_id = mod.get("id")
-            if not mod_id:
-                continue
+        # One bulk lookup instead of a request per mod
+        infos = self.client.get_mods_info(mod_ids)
 
-            # Get mod info from Modrinth
-            mod_info = self.client.get_mod_info(mod_id)
+        for mod_id in mod_ids:
+            mod_info = infos.get(mod_id)
             if not mod_info:
                 continue
 
@@ -490,16 +772,17 @@ class ModManager:
 
             # Display mod and slug info
             print(f"\nMod: {mod_info['title']} ({mod_id})")
-            print(f"Slug: {Fore.CYAN}{mod_info['slug']}{Style.RESET_ALL}")
+            print(f"Slug: {CYAN}{mod_info['slug']}{RESET}")
 
             # Prompt for slug update
             if self._should_update_to_slug(mod_id, mod_info["slug"]):
-                print(f"Updating ID from {mod_id} to {Fore.CYAN}{mod_info['slug']}{Style.RESET_ALL}")
-                if self.toml_handler.update_id_to_slug(self.config_path, mod_id, mod_info["slug"]):
-                    slugs_updated += 1
+                print(f"Updating ID from {mod_id} to {CYAN}{mod_info['slug']}{RESET}")
+                self._pending_slugs[mod_id] = mod_info["slug"]
+                slugs_updated += 1
             else:
                 print("Keeping current mod ID.")
 
+        self._flush_pending_updates()
         return slugs_updated
 
     def _should_update_to_slug(self, mod_id: str, slug: str) -> bool:
@@ -511,29 +794,45 @@ class ModManager:
         needs_update = []
         updates_performed = 0
 
-        for mod in self.config.get("mods", []):
-            # Skip non-Modrinth mods
-            if mod.get("type") != "modrinth":
-                continue
+        # Visit only the requested mods instead of filtering the whole config
+        if specific_mods:
+            candidates = (self._mods_by_id[mod_id] for mod_id in specific_mods if mod_id in self._mods_by_id)
+        else:
+            candidates = iter(self._mods_by_id.values())
 
-            mod_id = mod.get("id")
+        # Gather the eligible mods first so their metadata can be fetched in bulk
+        eligible: List[Tuple[str, str]] = []
+        for mod in candidates:
+            mod_id = mod["id"]
             current_version_id = mod.get("version")
 
-            # Skip mods without ID or version
-            if not mod_id or not current_version_id:
+            # Skip mods without a pinned version
+            if not current_version_id:
                 continue
 
-            # Skip mods not in the specific list if provided
-            if specific_mods and mod_id not in specific_mods:
-                continue
+            eligible.append((mod_id, current_version_id))
+
+        # Prefetch everything concurrently; the work is I/O-bound and the
+        # pooled session is thread-safe for GETs. The bulk metadata lookup is
+        # independent of the per-mod version fetches, so it shares the pool
+        # and overlaps with them. All network I/O finishes before the serial
+        # display/prompt loop below starts.
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            info_future = executor.submit(self.client.get_mods_info, [mod_id for mod_id, _ in eligible])
+            version_lists = list(
+                executor.map(
+                    lambda pair: self.client.get_mod_versions(pair[0], self.mc_version, self.mod_loader),
+                    eligible,
+                )
+            )
+            infos = info_future.result()
 
-            # Get mod info and versions
-            mod_info = self.client.get_mod_info(mod_id)
+        # Render status serially so display ordering stays stable
+        for (mod_id, current_version_id), versions in zip(eligible, version_lists):
+            mod_info = infos.get(mod_id)
             if not mod_info:
                 continue
 
-            versions = self.client.get_mod_versions(mod_id, self.mc_version, self.mod_loader)
-
             # Display mod status and handle updates
             mod_needs_update, mod_updated = self.display_mod_status(mod_info, versions, current_version_id, update_mode)
 
@@ -541,6 +840,7 @@ class ModManager:
                 needs_update.append(mod_id)
             updates_performed += mod_updated
 
+        self._flush_pending_updates()
         return needs_update, updates_performed
 
 
@@ -576,6 +876,11 @@ def main():
     DEBUG = args.debug
     file_path = args.file
 
+    # Initialize colorama only for terminals; piped output skips its
+    # per-write ANSI processing
+    if sys.stdout.isatty():
+        init()
+
     # Initialize and load config
     toml_handler = TomlHandler()
     config = toml_handler.load_config(file_path)
@@ -588,16 +893,19 @@ def main():
         print(f"Error: Could not find Minecraft version in {file_path}", file=sys.stderr)
         sys.exit(1)
 
-    # Initialize mod manager
-    manager = ModManager(file_path, mc_version, mod_loader)
+    # Initialize mod manager with the already-parsed config
+    manager = ModManager(file_path, mc_version, mod_loader, config=config)
 
-    # Handle slug conversion mode
-    if args.slugs:
-        handle_slug_conversion(manager, file_path)
-        return
+    try:
+        # Handle slug conversion mode
+        if args.slugs:
+            handle_slug_conversion(manager, file_path)
+            return
 
-    # Handle regular mod checking/updating
-    handle_mod_updates(manager, config, mc_version, mod_loader, file_path, args)
+        # Handle regular mod checking/updating
+        handle_mod_updates(manager, mc_version, mod_loader, file_path, args)
+    finally:
+        manager.close()
 
 
 def handle_slug_conversion(manager: ModManager, file_path: str) -> None:
@@ -612,14 +920,13 @@ def handle_slug_conversion(manager: ModManager, file_path: str) -> None:
 
 def handle_mod_updates(
     manager: ModManager,
-    config: Dict[str, Any],
     mc_version: str,
     mod_loader: str,
     file_path: str,
     args: argparse.Namespace,
 ) -> None:
     """Handle checking and updating mods."""
-    mods = config.get("mods", [])
+    mods = manager.config.get("mods", [])
     print(f"Checking {len(mods)} mods for Minecraft {mc_version} ({mod_loader})...")
     print("\nMod Status:")
     print("-" * 80)